@@ -187,7 +187,7 @@ async def evaluate(task_cfg, session: cb.DesktopSession) -> list[float]:
                     logger.warning(f"Reference file {file} not found in output directory")
 
             # Finalize and return normalized score
-            ctx.finalize(num_reference_files=len(reference_files), num_output_files=len(output_files))
+            await ctx.afinalize(num_reference_files=len(reference_files), num_output_files=len(output_files))
             return [ctx.get_final_score(num_items=len(reference_files))]
 
     except Exception as e:
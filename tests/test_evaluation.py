@@ -0,0 +1,162 @@
+import asyncio
+
+import pytest
+
+from utils import evaluation
+from utils.evaluation import _parse_batch_verdicts, evaluate_milestone_mode
+
+
+class FakeSession:
+    """Minimal DesktopSession stand-in serving files from in-memory directories."""
+
+    def __init__(self, dirs: dict[str, dict[str, bytes]]):
+        self.dirs = dirs
+
+    async def exists(self, path: str) -> bool:
+        return path in self.dirs
+
+    async def list_dir(self, path: str) -> list[str]:
+        return list(self.dirs[path])
+
+    async def read_bytes(self, path: str) -> bytes:
+        directory, _, name = path.rpartition("/")
+        return self.dirs[directory][name]
+
+
+def _milestone_session(num_files: int) -> FakeSession:
+    files = {f"floor_{i}.png": f"image {i}".encode() for i in range(num_files)}
+    return FakeSession({"/output": dict(files), "/reference": dict(files)})
+
+
+def _comparison(verdict: str):
+    async def compare(target_image_bytes, reference_image_bytes, identifier):
+        await asyncio.sleep(0)
+        return {
+            "score": 1.0 if verdict == "YES" else 0.0,
+            "vlm_response": verdict,
+            "prompt": f"Is this {identifier}?",
+            "model": "fake",
+            "mode": "comparison",
+            "error": None,
+        }
+
+    return compare
+
+
+def _run_milestone(tmp_path, verdict: str, num_files: int = 4, **kwargs):
+    return asyncio.run(evaluate_milestone_mode(
+        session=_milestone_session(num_files),
+        target_path="/output",
+        reference_path="/reference",
+        task_tag="test",
+        comparison_fn=_comparison(verdict),
+        output_dir=str(tmp_path),
+        **kwargs
+    ))
+
+
+@pytest.fixture(autouse=True)
+def serial_evaluation(monkeypatch):
+    # One comparison at a time makes early exits deterministic
+    monkeypatch.setenv("EVAL_CONCURRENCY", "1")
+
+
+def test_milestone_without_threshold_evaluates_everything(tmp_path):
+    score, details = _run_milestone(tmp_path, "YES")
+
+    assert score == 1.0
+    assert details["summary"]["num_evaluated"] == 4
+    assert details["summary"]["num_skipped"] == 0
+
+
+def test_milestone_stops_once_pass_is_decided(tmp_path):
+    score, details = _run_milestone(tmp_path, "YES", pass_threshold=0.5)
+
+    # Two passes out of four already reach 0.5
+    assert score == 0.5
+    assert details["summary"]["num_evaluated"] == 2
+    assert details["summary"]["num_skipped"] == 2
+
+
+def test_milestone_stops_once_fail_is_decided(tmp_path):
+    score, details = _run_milestone(tmp_path, "NO", pass_threshold=0.5)
+
+    # After three failures the best reachable score is 0.25
+    assert score == 0.0
+    assert details["summary"]["num_evaluated"] == 3
+    assert details["summary"]["num_skipped"] == 1
+
+
+def test_milestone_zero_threshold_is_decided_after_first_result(tmp_path):
+    score, details = _run_milestone(tmp_path, "NO", pass_threshold=0)
+
+    assert score == 0.0
+    assert details["summary"]["num_evaluated"] == 1
+    assert details["summary"]["num_skipped"] == 3
+
+
+def test_milestone_skipped_and_evaluated_cover_matching_files(tmp_path):
+    _, details = _run_milestone(tmp_path, "YES", num_files=7, pass_threshold=0.4)
+    summary = details["summary"]
+
+    assert summary["num_evaluated"] + summary["num_skipped"] == 7
+    assert summary["num_reference_files"] == 7
+
+
+def test_milestone_ignores_malformed_results_when_deciding(tmp_path):
+    async def compare(target_image_bytes, reference_image_bytes, identifier):
+        return {"score": None}
+
+    score, details = asyncio.run(evaluate_milestone_mode(
+        session=_milestone_session(4),
+        target_path="/output",
+        reference_path="/reference",
+        task_tag="test",
+        comparison_fn=compare,
+        output_dir=str(tmp_path),
+        pass_threshold=0.5
+    ))
+
+    assert score == 0.0
+    assert details["summary"]["num_skipped"] == 1
+
+
+def test_parse_batch_verdicts_plain_object():
+    assert _parse_batch_verdicts('{"1": "YES", "2": "NO"}') == {"1": "YES", "2": "NO"}
+
+
+def test_parse_batch_verdicts_strips_code_fences():
+    answer = '```json\n{"1": "YES", "2": "NO"}\n```'
+
+    assert _parse_batch_verdicts(answer) == {"1": "YES", "2": "NO"}
+
+
+@pytest.mark.parametrize(
+    "answer", ['["YES", "NO"]', '[{"1": "YES"}, {"2": "NO"}]', "YES", "", '"{"']
+)
+def test_parse_batch_verdicts_rejects_non_object_json(answer):
+    with pytest.raises(ValueError):
+        _parse_batch_verdicts(answer)
+
+
+def test_batch_compare_reports_missing_pairs(monkeypatch):
+    class FakeCompletions:
+        async def create(self, **kwargs):
+            message = type("Message", (), {"content": '```json\n{"1": "YES"}\n```'})
+            choice = type("Choice", (), {"message": message})
+            return type("Response", (), {"choices": [choice]})
+
+    class FakeClient:
+        chat = type("Chat", (), {"completions": FakeCompletions()})
+
+    async def fake_get_client(api_key=None):
+        return FakeClient()
+
+    monkeypatch.setattr(evaluation, "_get_client", fake_get_client)
+    pairs = [(b"target 1", b"reference 1", "floor 1"), (b"target 2", b"reference 2", "floor 2")]
+
+    results = asyncio.run(evaluation.batch_compare_screenshots_game(pairs))
+
+    assert [result["score"] for result in results] == [1.0, 0.0]
+    assert results[0]["error"] is None
+    assert results[1]["error"] == "No verdict for pair 2"
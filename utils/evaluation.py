@@ -1,21 +1,194 @@
 
 
-from openai import AsyncOpenAI
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
+import httpx
 import asyncio
-import base64
+import hashlib
+import io
 import os
 import logging
+import weakref
 import json
+from collections import OrderedDict
 from datetime import datetime
 from pathlib import Path
 from typing import Optional, Union, TYPE_CHECKING
 
+try:
+    # SIMD-accelerated base64; screenshots are encoded on every judge call
+    from pybase64 import b64encode as _b64encode
+except ImportError:
+    from base64 import b64encode as _b64encode
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 if TYPE_CHECKING:
     from cua_bench.computers.base import DesktopSession
 
 logger = logging.getLogger(__name__)
 
 
+def _eval_concurrency() -> int:
+    """Maximum number of concurrent judge calls (EVAL_CONCURRENCY, default 8)."""
+    return max(1, int(os.environ.get("EVAL_CONCURRENCY", "8")))
+
+
+def _dir_prefix(path: str) -> str:
+    """Return path with a trailing separator, so children join by concatenation."""
+    if not path or path.endswith(("/", os.sep)):
+        return path
+    return path + os.sep
+
+
+def _stem(file_name: str) -> str:
+    """File name without its extension (same as os.path.splitext for plain names)."""
+    stem, dot, _ = file_name.rpartition(".")
+    return stem if dot and stem.strip(".") else file_name
+
+
+# Images larger than this are encoded on every call instead of being cached
+_MAX_CACHED_IMAGE_BYTES = 4_000_000
+_DATA_URL_CACHE_SIZE = 32
+# Keyed by (fingerprint, mime_type) or, for downscaled images,
+# (source fingerprint, max_edge, image_format)
+_data_url_cache: OrderedDict[tuple, str] = OrderedDict()
+
+
+def _fp(image_bytes: bytes) -> bytes:
+    """Compact content fingerprint used to key image caches."""
+    return hashlib.blake2b(image_bytes, digest_size=16).digest()
+
+
+def _encode_data_url(image_bytes: bytes, mime_type: str = "image/png") -> str:
+    """
+    Encode image bytes as a base64 data URL.
+
+    Reference screenshots are judged repeatedly (once per question or per
+    comparison), so encodings of reasonably sized images are memoized. The
+    cache is keyed by content fingerprint rather than by the image bytes, so
+    it does not keep the original images alive.
+    """
+    prefix = f"data:{mime_type};base64,".encode("ascii")
+    if len(image_bytes) >= _MAX_CACHED_IMAGE_BYTES:
+        return (prefix + _b64encode(image_bytes)).decode("ascii")
+
+    key = (_fp(image_bytes), mime_type)
+    url = _data_url_cache.get(key)
+    if url is not None:
+        _data_url_cache.move_to_end(key)
+        return url
+
+    # Concatenate as bytes and decode once; base64 output is pure ASCII
+    url = (prefix + _b64encode(image_bytes)).decode("ascii")
+    _store_data_url(key, url)
+    return url
+
+
+def _store_data_url(key: tuple, url: str) -> None:
+    """Insert url into the data URL cache, evicting the least recently used entries."""
+    _data_url_cache[key] = url
+    while len(_data_url_cache) > _DATA_URL_CACHE_SIZE:
+        _data_url_cache.popitem(last=False)
+
+
+def _preprocess_image(image_bytes: bytes, max_edge: int, image_format: str) -> tuple[bytes, str]:
+    """
+    Downscale an image so its longer edge is at most max_edge and re-encode it.
+
+    Returns:
+        Tuple of (encoded_bytes, mime_type)
+    """
+    from PIL import Image
+
+    image = Image.open(io.BytesIO(image_bytes))
+    image.thumbnail((max_edge, max_edge))
+    image_format = "JPEG" if image_format.upper() == "JPG" else image_format.upper()
+    if image_format == "JPEG" and image.mode != "RGB":
+        image = image.convert("RGB")
+
+    # quality only applies to lossy encoders
+    save_kwargs = {"quality": 80} if image_format in ("JPEG", "WEBP") else {}
+    buffer = io.BytesIO()
+    image.save(buffer, format=image_format, **save_kwargs)
+    return buffer.getvalue(), f"image/{image_format.lower()}"
+
+
+async def _prepare_image_url(
+    image_bytes: bytes,
+    max_edge: Optional[int],
+    image_format: str
+) -> str:
+    """
+    Build the data URL for an image, downscaling it first if max_edge is set.
+
+    Downscaled URLs are cached under the source image's fingerprint, so a
+    reference judged repeatedly is only decoded and re-encoded once.
+    """
+    if max_edge is None:
+        return _encode_data_url(image_bytes)
+
+    key = (_fp(image_bytes), max_edge, image_format)
+    url = _data_url_cache.get(key)
+    if url is not None:
+        _data_url_cache.move_to_end(key)
+        return url
+
+    processed, mime_type = await asyncio.to_thread(
+        _preprocess_image, image_bytes, max_edge, image_format
+    )
+    # Downscaled images are small, so encode them directly and cache only the result
+    url = (f"data:{mime_type};base64,".encode("ascii") + _b64encode(processed)).decode("ascii")
+    _store_data_url(key, url)
+    return url
+
+
+_client: Optional[AsyncOpenAI] = None
+_client_key: Optional[tuple] = None
+_client_loop: Optional["weakref.ref[asyncio.AbstractEventLoop]"] = None
+
+
+async def _get_client(api_key: Optional[str] = None) -> AsyncOpenAI:
+    """
+    Return a shared OpenAI client, honouring OPENAI_API_KEY and OPENAI_API_BASE.
+
+    Reusing one client lets concurrent judge calls share pooled connections
+    instead of paying a TLS handshake per call. The client is rebuilt when the
+    credentials or the running event loop change, since pooled connections
+    cannot be reused across loops. The loop is only weakly referenced.
+    """
+    global _client, _client_key, _client_loop
+
+    api_key = api_key or os.environ.get("OPENAI_API_KEY")
+    # base_url is set from OPENAI_API_BASE when present (e.g., for LiteLLM)
+    api_base = os.environ.get("OPENAI_API_BASE")
+    loop = asyncio.get_running_loop()
+    key = (id(loop), api_key, api_base)
+
+    same_loop = _client_loop is not None and _client_loop() is loop
+    if _client is not None and _client_key == key and same_loop:
+        return _client
+
+    previous = _client if same_loop else None
+    # No await between the check above and this assignment, so no lock is needed
+    _client = AsyncOpenAI(
+        api_key=api_key,
+        base_url=api_base,
+        http_client=DefaultAsyncHttpxClient(
+            limits=httpx.Limits(max_connections=32, max_keepalive_connections=32)
+        ),
+    )
+    _client_key = key
+    _client_loop = weakref.ref(loop)
+
+    # Connections of a client bound to an old loop cannot be closed from here
+    if previous is not None:
+        await previous.close()
+    return _client
+
+
 async def llm_vision_judge(
     prompt: str,
     image_bytes: bytes,
@@ -26,7 +199,9 @@ async def llm_vision_judge(
     api_key: Optional[str] = None,
     return_details: bool = False,
     eval_context: Optional["EvaluationContext"] = None,
-    identifier: Optional[str] = None
+    identifier: Optional[str] = None,
+    max_edge: Optional[int] = None,
+    image_format: str = "webp"
 ) -> Union[str, float, dict]:
     """
     General-purpose LLM vision evaluation function supporting both single and dual image modes.
@@ -46,6 +221,10 @@ async def llm_vision_judge(
         eval_context: Optional EvaluationContext for automatic logging. When provided,
                      the result will be automatically logged to the context.
         identifier: Identifier for logging (required if eval_context is provided)
+        max_edge: If set, images are downscaled so their longer edge is at most this
+                  many pixels and re-encoded as image_format before sending. This
+                  shrinks the request payload; None sends the original bytes.
+        image_format: Pillow format used when max_edge is set (default: "webp")
 
     Returns:
         - dict with full evaluation details if return_details=True
@@ -56,32 +235,30 @@ async def llm_vision_judge(
     error_msg = None
     
     try:
+        mode = "comparison" if reference_image_bytes is not None else "single"
+
         # Initialize OpenAI client
-        api_key = api_key or os.environ.get("OPENAI_API_KEY")
-        api_base = os.environ.get("OPENAI_API_BASE")
-        
-        # Create client with base_url if OPENAI_API_BASE is set (e.g., for LiteLLM)
-        if api_base:
-            client = AsyncOpenAI(api_key=api_key, base_url=api_base)
-        else:
-            client = AsyncOpenAI(api_key=api_key)
+        client = await _get_client(api_key)
 
         # Build content array
-        primary_b64 = base64.b64encode(image_bytes).decode('utf-8')
         content = [
             {"type": "text", "text": prompt},
-            {"type": "image_url", "image_url": {"url": f"data:image/png;base64,{primary_b64}"}}
+            {
+                "type": "image_url",
+                "image_url": {
+                    "url": await _prepare_image_url(image_bytes, max_edge, image_format)
+                }
+            }
         ]
 
         # Add reference image if in comparison mode
-        mode = "single"
         if reference_image_bytes is not None:
-            reference_b64 = base64.b64encode(reference_image_bytes).decode('utf-8')
             content.append({
                 "type": "image_url",
-                "image_url": {"url": f"data:image/png;base64,{reference_b64}"}
+                "image_url": {
+                    "url": await _prepare_image_url(reference_image_bytes, max_edge, image_format)
+                }
             })
-            mode = "comparison"
 
         # Call OpenAI Vision API
         response = await client.chat.completions.create(
@@ -160,6 +337,20 @@ async def llm_vision_judge_single(
     )
 
 
+_GAME_PROMPT = """You are evaluating a game screenshot.
+
+Compare these two images:
+1. First image: A screenshot from the agent's playthrough
+2. Second image: A reference screenshot showing the correct state ({context})
+
+Question: Does the first image show that the player has successfully reached the same state as the reference image for {context}?
+
+Please analyze:
+{criteria}
+
+Answer with ONLY "YES" or "NO"."""
+
+
 async def compare_screenshots_game(
     target_image_bytes: bytes,
     reference_image_bytes: bytes,
@@ -178,28 +369,107 @@ async def compare_screenshots_game(
     Returns:
         Dictionary with evaluation details (score, vlm_response, prompt, etc.)
     """
+    prompt = _GAME_PROMPT.format(
+        context=context_description, criteria=comparison_criteria or ""
+    )
+
+    return await llm_vision_judge(
+        prompt=prompt,
+        image_bytes=target_image_bytes,
+        reference_image_bytes=reference_image_bytes,
+        return_details=True,
+        max_tokens=10
+    )
+
+
+def _parse_batch_verdicts(answer: str) -> dict[str, str]:
+    """Parse a {"1": "YES", "2": "NO"} style answer, tolerating code fences."""
+    start, end = answer.find("{"), answer.rfind("}")
+    if start == -1 or end < start:
+        raise ValueError(f"No JSON object in batch answer: {answer}")
+    verdicts = json.loads(answer[start:end + 1])
+    return {str(key): str(value) for key, value in verdicts.items()}
+
+
+async def batch_compare_screenshots_game(
+    pairs: list[tuple[bytes, bytes, str]],
+    comparison_criteria: Optional[str] = None,
+    model: str = "gpt-5.2"
+) -> list[dict]:
+    """
+    Compare several target/reference screenshot pairs with a single VLM call.
+
+    One request amortizes the prompt prefill and network round trip over all
+    pairs, at the cost of a longer multi-image context.
+
+    Args:
+        pairs: List of (target_image_bytes, reference_image_bytes, context_description)
+        comparison_criteria: Optional additional criteria applied to every pair
+        model: OpenAI model to use (default: "gpt-5.2")
+
+    Returns:
+        One evaluation dict per pair, in order, with the same keys as
+        compare_screenshots_game (score, vlm_response, prompt, model, mode, error)
+    """
     criteria = comparison_criteria or ""
+    pair_descriptions = "\n".join(
+        f"Pair {i}: {context_description}"
+        for i, (_, _, context_description) in enumerate(pairs, start=1)
+    )
 
-    prompt = f"""You are evaluating a game screenshot.
+    prompt = f"""You are evaluating game screenshots.
 
-Compare these two images:
+You will see {len(pairs)} numbered screenshot pairs. In each pair:
 1. First image: A screenshot from the agent's playthrough
-2. Second image: A reference screenshot showing the correct state ({context_description})
+2. Second image: A reference screenshot showing the correct state
+
+{pair_descriptions}
 
-Question: Does the first image show that the player has successfully reached the same state as the reference image for {context_description}?
+Question: For each pair, does the first image show that the player has successfully reached the same state as the reference image?
 
 Please analyze:
 {criteria}
 
-Answer with ONLY "YES" or "NO"."""
+Answer with ONLY a JSON object mapping each pair number to "YES" or "NO", e.g. {{"1": "YES", "2": "NO"}}."""
 
-    return await llm_vision_judge(
-        prompt=prompt,
-        image_bytes=target_image_bytes,
-        reference_image_bytes=reference_image_bytes,
-        return_details=True,
-        max_tokens=10
-    )
+    content = [{"type": "text", "text": prompt}]
+    for i, (target_image_bytes, reference_image_bytes, _) in enumerate(pairs, start=1):
+        content.extend([
+            {"type": "text", "text": f"Pair {i}:"},
+            {"type": "image_url", "image_url": {"url": _encode_data_url(target_image_bytes)}},
+            {"type": "image_url", "image_url": {"url": _encode_data_url(reference_image_bytes)}},
+        ])
+
+    max_tokens = 16 * len(pairs) + 16
+    verdicts = {}
+    error_msg = None
+    try:
+        client = await _get_client()
+        response = await client.chat.completions.create(
+            model=model,
+            messages=[{"role": "user", "content": content}],
+            max_completion_tokens=max_tokens
+        )
+        answer = response.choices[0].message.content.strip()
+        logger.info(f"LLM vision judge (batch mode, {len(pairs)} pairs): {answer}")
+        verdicts = _parse_batch_verdicts(answer)
+    except Exception as e:
+        logger.error(f"Error in batch_compare_screenshots_game: {e}")
+        error_msg = f"Error: {str(e)}"
+
+    results = []
+    for i in range(1, len(pairs) + 1):
+        verdict = verdicts.get(str(i))
+        results.append({
+            "vlm_response": verdict,
+            "score": 1.0 if verdict and "YES" in verdict.upper() else 0.0,
+            "prompt": prompt,
+            "model": model,
+            "mode": "batch",
+            "max_tokens": max_tokens,
+            "error": error_msg or (None if verdict is not None else f"No verdict for pair {i}")
+        })
+    return results
 
 
 async def collect_matching_files(
@@ -223,6 +493,45 @@ async def collect_matching_files(
     return target_files, reference_files
 
 
+class _AsyncBytesCache:
+    """
+    Small per-session LRU cache for remote file contents, keyed by remote path.
+
+    Entries live only as long as the session they were read through, so a
+    different VM or a re-provisioned session never sees another session's
+    bytes. Only used for reference files, which are immutable for the lifetime
+    of a session; agent outputs must always be read fresh.
+    """
+
+    def __init__(self, maxsize: int = 64):
+        self.maxsize = maxsize
+        self._sessions: "weakref.WeakKeyDictionary[DesktopSession, OrderedDict[str, bytes]]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    async def get(self, session: "DesktopSession", path: str) -> bytes:
+        """Return cached bytes for path, reading them through session on a miss."""
+        try:
+            data = self._sessions.setdefault(session, OrderedDict())
+        except TypeError:
+            # Session cannot be weakly referenced; skip caching
+            return await session.read_bytes(path)
+
+        if path in data:
+            data.move_to_end(path)
+            return data[path]
+
+        content = await session.read_bytes(path)
+        data[path] = content
+        data.move_to_end(path)
+        while len(data) > self.maxsize:
+            data.popitem(last=False)
+        return content
+
+
+_reference_bytes_cache = _AsyncBytesCache()
+
+
 def save_evaluation_results(
     evaluation_details: dict,
     task_tag: str,
@@ -247,8 +556,24 @@ def save_evaluation_results(
         json_filename = f"{task_tag}_evaluation_{timestamp}.json"
         json_filepath = os.path.join(output_dir, json_filename)
 
-        with open(json_filepath, 'w') as f:
-            json.dump(evaluation_details, f, indent=2)
+        encoded = None
+        if orjson is not None:
+            try:
+                encoded = orjson.dumps(
+                    evaluation_details,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                )
+            except orjson.JSONEncodeError:
+                # orjson rejects values the stdlib json module accepts, e.g.
+                # integers wider than 64 bits or tuple/float dict keys
+                pass
+
+        if encoded is not None:
+            with open(json_filepath, 'wb') as f:
+                f.write(encoded)
+        else:
+            with open(json_filepath, 'w') as f:
+                json.dump(evaluation_details, f, indent=2)
 
         logger.info(f"Evaluation details saved to: {json_filepath}")
         return json_filepath
@@ -307,6 +632,7 @@ class EvaluationContext:
             **extra_metadata
         }
         self._total_score = 0.0
+        self._final_score = 0.0
         self._num_evaluated = 0
         self._finalized = False
     
@@ -386,32 +712,61 @@ class EvaluationContext:
         """Get the number of evaluations logged."""
         return self._num_evaluated
     
-    def finalize(self, **extra_summary) -> tuple[float, dict]:
+    def finalize(self, num_items: Optional[int] = None, **extra_summary) -> tuple[float, dict]:
         """
         Finalize evaluation, add summary, and save results.
         
         Args:
+            num_items: If provided, the final score is the total score divided
+                      by this number (see get_final_score)
             **extra_summary: Additional fields to include in summary
             
         Returns:
             Tuple of (final_score, evaluation_details)
         """
         if self._finalized:
-            return self._total_score, self.evaluation_details
+            return self._final_score, self.evaluation_details
         
-        self.evaluation_details["summary"] = {
-            "total_score": self._total_score,
-            "num_evaluated": self._num_evaluated,
-            **extra_summary
-        }
-        
-        logger.info(f"Evaluation complete. Total score: {self._total_score} ({self._num_evaluated} evaluated)")
+        self._add_summary(num_items, **extra_summary)
         
         if self.auto_save:
             save_evaluation_results(self.evaluation_details, self.task_tag, self.output_dir)
         
         self._finalized = True
-        return self._total_score, self.evaluation_details
+        return self._final_score, self.evaluation_details
+    
+    async def afinalize(
+        self, num_items: Optional[int] = None, **extra_summary
+    ) -> tuple[float, dict]:
+        """
+        Async variant of finalize() that saves results off the event loop.
+        
+        Saving does blocking disk I/O, which would otherwise stall judge calls
+        still in flight on the same loop.
+        """
+        if self._finalized:
+            return self._final_score, self.evaluation_details
+        
+        self._add_summary(num_items, **extra_summary)
+        
+        if self.auto_save:
+            await asyncio.to_thread(
+                save_evaluation_results, self.evaluation_details, self.task_tag, self.output_dir
+            )
+        
+        self._finalized = True
+        return self._final_score, self.evaluation_details
+    
+    def _add_summary(self, num_items: Optional[int] = None, **extra_summary) -> None:
+        """Attach the summary block to the evaluation details."""
+        self._final_score = self.get_final_score(num_items=num_items)
+        self.evaluation_details["summary"] = {
+            "total_score": self._final_score,
+            "num_evaluated": self._num_evaluated,
+            **extra_summary
+        }
+        
+        logger.info(f"Evaluation complete. Total score: {self._final_score} ({self._num_evaluated} evaluated)")
     
     async def __aenter__(self) -> "EvaluationContext":
         """Async context manager entry."""
@@ -420,7 +775,7 @@ class EvaluationContext:
     async def __aexit__(self, exc_type, exc_val, exc_tb) -> bool:
         """Async context manager exit - auto-finalize on success."""
         if exc_type is None and not self._finalized:
-            self.finalize()
+            await self.afinalize()
         return False
     
     def __enter__(self) -> "EvaluationContext":
@@ -440,10 +795,22 @@ async def evaluate_milestone_mode(
     reference_path: str,
     task_tag: str,
     comparison_fn: callable,
-    output_dir: Optional[str] = None
+    output_dir: Optional[str] = None,
+    batch_comparison_fn: Optional[callable] = None,
+    batch_size: int = 4,
+    pass_threshold: Optional[float] = None
 ) -> tuple[float, dict]:
     """
     Evaluate using milestone mode: compare agent-saved screenshots with references.
+
+    Matching files are compared concurrently, bounded by EVAL_CONCURRENCY. If
+    batch_comparison_fn is given (e.g. batch_compare_screenshots_game), files are
+    judged in groups of batch_size per call instead of one call per file.
+
+    If pass_threshold is given, remaining comparisons are cancelled as soon as the
+    final score is certain to be at or above it, or certain to fall below it. The
+    returned score then only counts the comparisons that finished, which is
+    enough to decide pass/fail but not an exact score.
     """
     # Check if target directory exists
     exists = await session.exists(target_path)
@@ -456,6 +823,65 @@ async def evaluate_milestone_mode(
         session, target_path, reference_path
     )
 
+    semaphore = asyncio.Semaphore(_eval_concurrency())
+    reference_set = frozenset(reference_files)
+    matching_files = [file for file in target_files if file in reference_set]
+
+    if batch_comparison_fn is not None:
+        size = max(1, batch_size)
+        chunks = [
+            matching_files[i:i + size] for i in range(0, len(matching_files), size)
+        ]
+    else:
+        chunks = [[file] for file in matching_files]
+
+    target_prefix = _dir_prefix(target_path)
+    reference_prefix = _dir_prefix(reference_path)
+
+    # Prefetch every matching reference in one round of concurrent reads
+    reference_bytes = await asyncio.gather(
+        *[_reference_bytes_cache.get(session, reference_prefix + file)
+          for file in matching_files],
+        return_exceptions=True
+    )
+    reference_bytes_by_file = dict(zip(matching_files, reference_bytes))
+
+    async def _eval_chunk(files: list[str]) -> list[dict]:
+        """Download and compare a group of target/reference pairs."""
+        async with semaphore:
+            items = [
+                {
+                    "identifier": _stem(file),
+                    "target_file_path": target_prefix + file,
+                    "reference_file_path": reference_prefix + file,
+                }
+                for file in files
+            ]
+            for file in files:
+                logger.info(f"Evaluating milestone: {file}")
+
+            # Download target images from remote server concurrently
+            target_bytes = await asyncio.gather(
+                *[session.read_bytes(item["target_file_path"]) for item in items]
+            )
+
+            pairs = []
+            for file, item, target_image_bytes in zip(files, items, target_bytes):
+                reference_image_bytes = reference_bytes_by_file[file]
+                if isinstance(reference_image_bytes, BaseException):
+                    raise reference_image_bytes
+                pairs.append((target_image_bytes, reference_image_bytes, item["identifier"]))
+
+            # Compare screenshots
+            if batch_comparison_fn is not None:
+                eval_results = await batch_comparison_fn(pairs)
+            else:
+                eval_results = [await comparison_fn(*pair) for pair in pairs]
+
+            for item, eval_result in zip(items, eval_results):
+                item["eval_result"] = eval_result
+            return items
+
     async with EvaluationContext(
         task_tag=task_tag,
         mode="milestone",
@@ -463,49 +889,97 @@ async def evaluate_milestone_mode(
         target_path=target_path,
         reference_path=reference_path
     ) as ctx:
-        # Evaluate matching files
-        for file in target_files:
-            if file in reference_files:
+        async def _run_chunk(index: int) -> tuple[int, Union[list[dict], BaseException]]:
+            try:
+                return index, await _eval_chunk(chunks[index])
+            except Exception as e:
+                return index, e
+
+        # Evaluate matching files concurrently, stopping early once the
+        # pass/fail outcome is decided
+        tasks = [asyncio.create_task(_run_chunk(index)) for index in range(len(chunks))]
+        results = {}
+        decided_score = 0.0
+        pending_files = len(matching_files)
+        try:
+            for next_result in asyncio.as_completed(tasks):
+                index, chunk_result = await next_result
+                results[index] = chunk_result
+                pending_files -= len(chunks[index])
+                if not isinstance(chunk_result, BaseException):
+                    for item in chunk_result:
+                        # Malformed results are logged as errors below and score 0
+                        eval_result = item.get("eval_result")
+                        if isinstance(eval_result, dict):
+                            decided_score += eval_result.get("score") or 0.0
+
+                if pass_threshold is not None and reference_files:
+                    min_final = decided_score / len(reference_files)
+                    max_final = (decided_score + pending_files) / len(reference_files)
+                    decided = min_final >= pass_threshold or max_final < pass_threshold
+                    if pending_files and decided:
+                        logger.info(
+                            f"Milestone outcome decided against threshold {pass_threshold}; "
+                            f"skipping {pending_files} remaining comparisons"
+                        )
+                        break
+        finally:
+            for task in tasks:
+                task.cancel()
+
+        # Log results in file order
+        for index, files in enumerate(chunks):
+            if index not in results:
+                continue
+            chunk_result = results[index]
+            if isinstance(chunk_result, BaseException):
+                for file in files:
+                    ctx.log_error(identifier=file, error=chunk_result)
+                continue
+
+            for file, result in zip(files, chunk_result):
                 try:
-                    target_file_path = os.path.join(target_path, file)
-                    reference_file_path = os.path.join(reference_path, file)
-                    identifier = os.path.splitext(file)[0]
-
-                    logger.info(f"Evaluating milestone: {file}")
-
-                    # Download images from remote server
-                    target_image_bytes = await session.read_bytes(target_file_path)
-                    reference_image_bytes = await session.read_bytes(reference_file_path)
-
-                    # Compare screenshots
-                    eval_result = await comparison_fn(
-                        target_image_bytes, reference_image_bytes, identifier
-                    )
-
+                    eval_result = result["eval_result"]
                     score = eval_result["score"]
                     ctx.log_evaluation(
-                        identifier=identifier,
+                        identifier=result["identifier"],
                         score=score,
                         vlm_response=eval_result["vlm_response"],
                         prompt=eval_result["prompt"],
                         model=eval_result["model"],
                         mode=eval_result["mode"],
                         error=eval_result["error"],
-                        target_file_path=target_file_path,
-                        reference_file_path=reference_file_path,
+                        target_file_path=result["target_file_path"],
+                        reference_file_path=result["reference_file_path"],
                         file=file
                     )
-                    ctx.add_score(score / len(reference_files))
+                    ctx.add_score(score)
 
                 except Exception as e:
                     ctx.log_error(identifier=file, error=e)
 
-        return ctx.finalize(
+        return await ctx.afinalize(
+            num_items=len(reference_files),
             num_reference_files=len(reference_files),
-            num_target_files=len(target_files)
+            num_target_files=len(target_files),
+            num_skipped=pending_files
         )
 
 
+def _load_trajectory(path: Path) -> dict:
+    """Parse an agent response file, using orjson when available."""
+    with open(path, 'rb') as f:
+        raw = f.read()
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            # orjson rejects NaN/Infinity and integers wider than 64 bits,
+            # which the stdlib json module writes and accepts
+            pass
+    return json.loads(raw)
+
+
 async def evaluate_deliverable_mode(
     session: "DesktopSession",
     trajectory_dir: str,
@@ -518,6 +992,9 @@ async def evaluate_deliverable_mode(
 ) -> tuple[float, dict]:
     """
     Evaluate using deliverable mode: replay trajectory and take screenshots at specified points.
+
+    Once the replay finishes, the screenshots are compared with their references
+    concurrently, bounded by EVAL_CONCURRENCY.
     """
     from cua_bench import replay_trajectory
 
@@ -529,16 +1006,20 @@ async def evaluate_deliverable_mode(
         reference_path=reference_path,
         screenshot_points=screenshot_points
     ) as ctx:
+        reference_files = []
+        reference_prefetch = None
         try:
             # Get reference files to know what to compare
             reference_files = await session.list_dir(reference_path)
+            reference_prefix = _dir_prefix(reference_path)
+            # (identifier, file) pairs, so each name is split only once
+            reference_ids = [
+                (_stem(ref_file), ref_file) for ref_file in reference_files
+            ]
 
             # Replay trajectory with screenshots at specified points
             logger.info(f"Replaying trajectory from: {trajectory_dir}")
 
-            from pathlib import Path
-            import json
-
             trajectory_path = Path(trajectory_dir)
             if not trajectory_path.exists():
                 raise FileNotFoundError(f"Trajectory directory not found: {trajectory_dir}")
@@ -551,9 +1032,15 @@ async def evaluate_deliverable_mode(
             latest_response_file = response_files[-1]
             logger.info(f"Using trajectory file: {latest_response_file.name}")
 
+            # Read the references in the background while the trajectory replays
+            reference_prefetch = asyncio.gather(
+                *[_reference_bytes_cache.get(session, reference_prefix + ref_file)
+                  for ref_file in reference_files],
+                return_exceptions=True
+            )
+
             # Load and extract actions
-            with open(latest_response_file, "r") as f:
-                data = json.load(f)
+            data = await asyncio.to_thread(_load_trajectory, latest_response_file)
 
             messages = data.get("kwargs", {}).get("messages", [])
             actions_to_execute = []
@@ -587,68 +1074,105 @@ async def evaluate_deliverable_mode(
                     except Exception as e:
                         logger.error(f"Action {action_type} failed: {e}")
 
-                # Take screenshot if at a screenshot point
+                # Take screenshot if at a screenshot point. The capture overlaps
+                # the post-action delay but completes before the next action.
                 if i + 1 in screenshot_points:
-                    try:
-                        screenshot_bytes = await session.screenshot()
+                    screenshot_bytes, _ = await asyncio.gather(
+                        session.screenshot(), asyncio.sleep(action_delay), return_exceptions=True
+                    )
+                    if isinstance(screenshot_bytes, BaseException):
+                        logger.error(
+                            f"Failed to take screenshot at action {i+1}: {screenshot_bytes}"
+                        )
+                    else:
                         # Map this screenshot to corresponding reference file
                         point_index = screenshot_points.index(i + 1)
                         if point_index < len(reference_files):
-                            identifier = os.path.splitext(reference_files[point_index])[0]
+                            identifier = reference_ids[point_index][0]
                             screenshots_taken[identifier] = screenshot_bytes
                             logger.info(f"Screenshot taken at action {i+1} for identifier '{identifier}'")
-                    except Exception as e:
-                        logger.error(f"Failed to take screenshot at action {i+1}: {e}")
-
-                await asyncio.sleep(action_delay)
-
-            # Now compare screenshots with references
-            for ref_file in reference_files:
-                identifier = os.path.splitext(ref_file)[0]
-
-                if identifier in screenshots_taken:
-                    try:
-                        reference_file_path = os.path.join(reference_path, ref_file)
-                        reference_image_bytes = await session.read_bytes(reference_file_path)
-                        target_image_bytes = screenshots_taken[identifier]
-
-                        logger.info(f"Evaluating deliverable: {identifier}")
+                else:
+                    await asyncio.sleep(action_delay)
+
+            # Now compare screenshots with references. Replay is done and the
+            # screenshots are in memory, so every comparison is independent.
+            semaphore = asyncio.Semaphore(_eval_concurrency())
+            matching_ids = [
+                (identifier, ref_file) for identifier, ref_file in reference_ids
+                if identifier in screenshots_taken
+            ]
+            reference_bytes_by_file = dict(zip(reference_files, await reference_prefetch))
+
+            async def _eval_ref(identifier: str, ref_file: str) -> dict:
+                """Compare the replay screenshot for one reference file."""
+                reference_image_bytes = reference_bytes_by_file[ref_file]
+                if isinstance(reference_image_bytes, BaseException):
+                    raise reference_image_bytes
+
+                async with semaphore:
+                    logger.info(f"Evaluating deliverable: {identifier}")
 
-                        # Compare screenshots
-                        eval_result = await comparison_fn(
-                            target_image_bytes, reference_image_bytes, identifier
-                        )
+                    # Compare screenshots
+                    return await comparison_fn(
+                        screenshots_taken[identifier], reference_image_bytes, identifier
+                    )
 
-                        score = eval_result["score"]
-                        ctx.log_evaluation(
-                            identifier=identifier,
-                            score=score,
-                            vlm_response=eval_result["vlm_response"],
-                            prompt=eval_result["prompt"],
-                            model=eval_result["model"],
-                            mode=eval_result["mode"],
-                            error=eval_result["error"],
-                            reference_file=ref_file,
-                            reference_file_path=reference_file_path
-                        )
-                        ctx.add_score(score / len(reference_files))
+            results = await asyncio.gather(
+                *[_eval_ref(identifier, ref_file) for identifier, ref_file in matching_ids],
+                return_exceptions=True
+            )
+            results_by_file = {
+                ref_file: result for (_, ref_file), result in zip(matching_ids, results)
+            }
 
-                    except Exception as e:
-                        ctx.log_error(identifier=identifier, error=e)
-                else:
+            for identifier, ref_file in reference_ids:
+                if ref_file not in results_by_file:
                     ctx.log_evaluation(
                         identifier=identifier,
                         score=0.0,
                         error="No screenshot taken at corresponding point"
                     )
+                    continue
+
+                eval_result = results_by_file[ref_file]
+                if isinstance(eval_result, BaseException):
+                    ctx.log_error(identifier=identifier, error=eval_result)
+                    continue
+
+                try:
+                    score = eval_result["score"]
+                    ctx.log_evaluation(
+                        identifier=identifier,
+                        score=score,
+                        vlm_response=eval_result["vlm_response"],
+                        prompt=eval_result["prompt"],
+                        model=eval_result["model"],
+                        mode=eval_result["mode"],
+                        error=eval_result["error"],
+                        reference_file=ref_file,
+                        reference_file_path=reference_prefix + ref_file
+                    )
+                    ctx.add_score(score)
 
-            return ctx.finalize(
+                except Exception as e:
+                    ctx.log_error(identifier=identifier, error=e)
+
+            return await ctx.afinalize(
+                num_items=len(reference_files),
                 num_reference_files=len(reference_files),
                 num_screenshots_taken=len(screenshots_taken),
                 total_actions_replayed=len(actions_to_execute)
             )
 
         except Exception as e:
+            if reference_prefetch is not None:
+                reference_prefetch.cancel()
+                try:
+                    await reference_prefetch
+                except asyncio.CancelledError:
+                    pass
             logger.error(f"Error in deliverable evaluation: {e}")
             ctx.evaluation_details["error"] = str(e)
-            return ctx.finalize(error=str(e))
+            # Scores are summed raw, so normalize here too; without references
+            # nothing has been scored and the total is 0
+            return await ctx.afinalize(num_items=len(reference_files), error=str(e))